@@ -0,0 +1,125 @@
+import gc
+import json
+import time
+import argparse
+import tracemalloc
+import pandas as pd
+from prediction_records import ROW_COLUMNS, dumps_predictions, loads_predictions, orjson
+
+predictions_file = "predictions.json"
+
+
+def build_dataset(predictions_file=predictions_file, size=100000):
+    """Repeat the sample predictions up to size, giving each copy its own tweet ids"""
+    with open(predictions_file, "r", encoding="utf-8") as f:
+        sample = json.load(f)
+    dataset = []
+    for i in range(size):
+        prediction = dict(sample[i % len(sample)])
+        tweet = dict(prediction["original_tweet"])
+        tweet["id"] = f"{tweet['id']}-{i // len(sample)}"
+        prediction["original_tweet"] = tweet
+        dataset.append(prediction)
+    return dataset
+
+
+def measure_memory(load, data):
+    """Bytes allocated per record while decoding data with load"""
+    gc.collect()
+    tracemalloc.start()
+    records = load(data)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / len(records)
+
+
+def measure_throughput(func, arg, count, repeat=3):
+    """Best-of-repeat records per second"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - start)
+    return count / best
+
+
+def measure_frame_memory(load, data):
+    """DataFrame bytes per row (tracemalloc misses Arrow-backed string columns)"""
+    frame = load(data)
+    return frame.memory_usage(deep=True).sum() / len(frame)
+
+
+def legacy_frame(data):
+    """Dashboard load path before records: json + json_normalize"""
+    return pd.json_normalize(json.loads(data), sep="_")
+
+
+def records_frame(data):
+    """Dashboard load path with records: load_predictions + DataFrame(to_row)"""
+    return pd.DataFrame(
+        [prediction.to_row() for prediction in loads_predictions(data)],
+        columns=ROW_COLUMNS,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare dict + json against Prediction records + fast serializer"
+    )
+    parser.add_argument("--size", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    dataset = build_dataset(size=args.size)
+    records = loads_predictions(json.dumps(dataset).encode("utf-8"))
+
+    legacy_bytes = json.dumps(dataset, indent=2, ensure_ascii=False).encode("utf-8")
+    records_bytes = dumps_predictions(records)
+
+    def legacy_dumps(data):
+        return json.dumps(data, indent=2, ensure_ascii=False, default=str)
+
+    results = [
+        (
+            "dict + json",
+            measure_memory(json.loads, legacy_bytes),
+            measure_throughput(legacy_dumps, dataset, args.size, args.repeat),
+            measure_throughput(json.loads, legacy_bytes, args.size, args.repeat),
+        ),
+        (
+            "Prediction + " + ("orjson" if orjson is not None else "json"),
+            measure_memory(loads_predictions, records_bytes),
+            measure_throughput(dumps_predictions, records, args.size, args.repeat),
+            measure_throughput(loads_predictions, records_bytes, args.size, args.repeat),
+        ),
+    ]
+
+    print(f"Records: {args.size}")
+    print(f"predictions.json size: dict + json {len(legacy_bytes):,} B, records {len(records_bytes):,} B")
+    print("-" * 72)
+    print(f"{'Approach':<22}{'Memory/record':>16}{'Encode rec/s':>17}{'Decode rec/s':>17}")
+    for name, memory, encode, decode in results:
+        print(f"{name:<22}{memory:>14.0f} B{encode:>17,.0f}{decode:>17,.0f}")
+    print("-" * 72)
+
+    # Dashboard load: bytes on disk -> DataFrame
+    frames = [
+        (
+            "json_normalize",
+            measure_frame_memory(legacy_frame, legacy_bytes),
+            measure_throughput(legacy_frame, legacy_bytes, args.size, args.repeat),
+        ),
+        (
+            "records + DataFrame",
+            measure_frame_memory(records_frame, records_bytes),
+            measure_throughput(records_frame, records_bytes, args.size, args.repeat),
+        ),
+    ]
+    print(f"{'Dashboard load':<22}{'Frame/record':>16}{'Load rec/s':>17}")
+    for name, memory, load in frames:
+        print(f"{name:<22}{memory:>14.0f} B{load:>17,.0f}")
+    print("-" * 72)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,388 @@
+import os
+import csv
+import io
+import json
+import time
+import argparse
+import tempfile
+from prediction_records import ROW_COLUMNS, Prediction, orjson
+
+predictions_file = "predictions.json"
+export_folder = "exports"
+chunk_size = 1000
+read_size = 64 * 1024
+# Dashboard export files older than this (seconds) are removed
+export_max_age = 60 * 60
+
+# Characters that can continue a JSON number
+NUMBER_CHARS = set(".eE+-0123456789")
+
+EXPORT_FORMATS = ("csv", "jsonl", "parquet")
+EXPORT_MIME_TYPES = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+EXPORT_COLUMNS = ROW_COLUMNS
+
+
+def iter_predictions(predictions_file=predictions_file, read_size=read_size):
+    """
+    Yield predictions one by one from a JSON array file.
+    The file is read in blocks of read_size characters, so only the current
+    prediction is ever held in memory.
+    """
+    decoder = json.JSONDecoder()
+    with open(predictions_file, "r", encoding="utf-8") as f:
+        buffer = ""
+        pos = 0
+        eof = False
+        # start -> first (after "[") -> separator (after a value) -> value (after ",")
+        # -> end (after "]", only whitespace may follow)
+        state = "start"
+        while True:
+            while pos < len(buffer) and buffer[pos].isspace():
+                pos += 1
+            need_more = pos == len(buffer)
+            if not need_more:
+                char = buffer[pos]
+                if state == "start":
+                    if char != "[":
+                        raise ValueError(
+                            f"{predictions_file} does not contain a JSON array"
+                        )
+                    state = "first"
+                    pos += 1
+                    continue
+                if state == "end":
+                    raise ValueError(
+                        f"Unexpected content after the array in {predictions_file}: {char!r}"
+                    )
+                if state == "separator":
+                    if char == "]":
+                        state = "end"
+                        pos += 1
+                        continue
+                    if char != ",":
+                        raise ValueError(
+                            f"Expected ',' or ']' in {predictions_file}, got {char!r}"
+                        )
+                    state = "value"
+                    pos += 1
+                    continue
+                if char == "]" and state == "first":
+                    state = "end"
+                    pos += 1
+                    continue
+                if char in ",]":
+                    raise ValueError(
+                        f"Expected a value in {predictions_file}, got {char!r}"
+                    )
+                try:
+                    obj, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    # The value may continue past the end of the buffer
+                    if eof:
+                        raise
+                    need_more = True
+                else:
+                    # A value ending exactly at the buffer edge may be truncated,
+                    # and a number may continue past it (e.g. "0" of "0.5")
+                    truncated = end == len(buffer) or (
+                        isinstance(obj, (int, float))
+                        and not isinstance(obj, bool)
+                        and buffer[end] in NUMBER_CHARS
+                    )
+                    if eof or not truncated:
+                        yield obj
+                        pos = end
+                        state = "separator"
+                        continue
+                    need_more = True
+            if eof:
+                if state in ("start", "end"):
+                    return
+                raise ValueError(f"Unexpected end of file in {predictions_file}")
+            # Grow reads with the pending value so long values stay linear
+            data = f.read(max(read_size, len(buffer) - pos))
+            eof = not data
+            buffer = buffer[pos:] + data
+            pos = 0
+
+
+def flatten_prediction(prediction):
+    """Flatten a prediction and its tweet metadata into an export row"""
+    return Prediction.from_dict(prediction).to_row()
+
+
+def matches_filters(prediction, extraction_class=None, location=None, author=None):
+    """Check a prediction against the dashboard filters ("All" or None disables a filter)"""
+    if extraction_class not in (None, "All"):
+        if prediction.get("extraction_class") != extraction_class:
+            return False
+    if location not in (None, "All"):
+        if prediction.get("location") != location:
+            return False
+    if author not in (None, "All"):
+        if (prediction.get("original_tweet") or {}).get("author") != author:
+            return False
+    return True
+
+
+def iter_export_chunks(
+    predictions_file=predictions_file,
+    chunk_size=chunk_size,
+    extraction_class=None,
+    location=None,
+    author=None,
+):
+    """Yield lists of at most chunk_size flattened rows matching the filters"""
+    chunk = []
+    for prediction in iter_predictions(predictions_file):
+        if not isinstance(prediction, dict):
+            raise ValueError(
+                f"Expected JSON objects in {predictions_file}, got {type(prediction).__name__}"
+            )
+        if not matches_filters(prediction, extraction_class, location, author):
+            continue
+        chunk.append(flatten_prediction(prediction))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class _ByteSink(io.RawIOBase):
+    """Write-only stream that hands out whatever was written since the last drain"""
+
+    def __init__(self):
+        self._parts = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        data = bytes(data)
+        self._parts.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self):
+        data = b"".join(self._parts)
+        self._parts = []
+        return data
+
+
+def _parquet_schema():
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError("Parquet export requires pyarrow: pip install pyarrow")
+    int_columns = {
+        "charInterval_start",
+        "charInterval_end",
+        "original_tweet_likes",
+        "original_tweet_retweets",
+        "original_tweet_views",
+    }
+    bool_columns = {"validated", "outcome"}
+
+    def column_type(column):
+        if column in int_columns:
+            return pa.int64()
+        if column in bool_columns:
+            return pa.bool_()
+        return pa.string()
+
+    return pa.schema([(column, column_type(column)) for column in EXPORT_COLUMNS])
+
+
+def _iter_csv_bytes(chunks):
+    text = io.StringIO()
+    writer = csv.DictWriter(text, fieldnames=EXPORT_COLUMNS)
+    writer.writeheader()
+    for chunk in chunks:
+        writer.writerows(chunk)
+        yield text.getvalue().encode("utf-8")
+        text.seek(0)
+        text.truncate()
+    # Header only when nothing matched
+    if text.tell():
+        yield text.getvalue().encode("utf-8")
+
+
+def _iter_jsonl_bytes(chunks):
+    for chunk in chunks:
+        if orjson is not None:
+            lines = [orjson.dumps(row) for row in chunk]
+        else:
+            lines = [json.dumps(row, ensure_ascii=False).encode("utf-8") for row in chunk]
+        yield b"\n".join(lines) + b"\n"
+
+
+def _iter_parquet_bytes(chunks):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = _parquet_schema()
+    sink = _ByteSink()
+    with pq.ParquetWriter(sink, schema) as writer:
+        for chunk in chunks:
+            # One row group per chunk, flushed to the caller straight away
+            writer.write_table(pa.Table.from_pylist(chunk, schema=schema))
+            data = sink.drain()
+            if data:
+                yield data
+    yield sink.drain()
+
+
+def iter_export_bytes(
+    fmt,
+    predictions_file=predictions_file,
+    chunk_size=chunk_size,
+    extraction_class=None,
+    location=None,
+    author=None,
+):
+    """
+    Stream filtered predictions encoded as csv, jsonl or parquet.
+    Bytes are yielded per chunk so the caller can start sending them
+    before the whole export is done.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format '{fmt}', use one of {EXPORT_FORMATS}")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    if fmt == "parquet":
+        # Fail before reading anything if pyarrow is missing
+        _parquet_schema()
+    chunks = iter_export_chunks(
+        predictions_file, chunk_size, extraction_class, location, author
+    )
+    if fmt == "csv":
+        return _iter_csv_bytes(chunks)
+    if fmt == "jsonl":
+        return _iter_jsonl_bytes(chunks)
+    return _iter_parquet_bytes(chunks)
+
+
+def export_predictions(
+    output_path,
+    fmt=None,
+    predictions_file=predictions_file,
+    chunk_size=chunk_size,
+    extraction_class=None,
+    location=None,
+    author=None,
+):
+    """Write filtered predictions to output_path chunk by chunk and return the path"""
+    if fmt is None:
+        fmt = os.path.splitext(output_path)[1].lstrip(".").lower()
+    data = iter_export_bytes(
+        fmt, predictions_file, chunk_size, extraction_class, location, author
+    )
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with open(output_path, "wb") as f:
+        for block in data:
+            f.write(block)
+    return output_path
+
+
+def remove_stale_exports(export_folder=export_folder, max_age=export_max_age):
+    """Delete export files older than max_age seconds, so exports/ stays bounded"""
+    if not os.path.isdir(export_folder):
+        return
+    cutoff = time.time() - max_age
+    for name in os.listdir(export_folder):
+        path = os.path.join(export_folder, name)
+        try:
+            if os.path.isfile(path) and os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except OSError:
+            # Another session may have removed it already
+            pass
+
+
+def read_export(
+    fmt,
+    predictions_file=predictions_file,
+    chunk_size=chunk_size,
+    extraction_class=None,
+    location=None,
+    author=None,
+    export_folder=export_folder,
+):
+    """
+    Export to a temporary file under export_folder chunk by chunk and return its bytes.
+    The file is unique per call and always removed, even when the export fails.
+    """
+    remove_stale_exports(export_folder)
+    os.makedirs(export_folder, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        dir=export_folder, suffix=f".{fmt}", delete=False
+    ) as f:
+        export_path = f.name
+    try:
+        export_predictions(
+            export_path,
+            fmt,
+            predictions_file,
+            chunk_size,
+            extraction_class,
+            location,
+            author,
+        )
+        with open(export_path, "rb") as f:
+            return f.read()
+    finally:
+        os.remove(export_path)
+
+
+def _chunk_size_arg(value):
+    chunk_size = int(value)
+    if chunk_size < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {chunk_size}")
+    return chunk_size
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Export filtered predictions to CSV, JSONL or Parquet"
+    )
+    parser.add_argument("output", help="Output file, e.g. exports/predictions.csv")
+    parser.add_argument(
+        "--format",
+        choices=EXPORT_FORMATS,
+        help="Output format (defaults to the output file extension)",
+    )
+    parser.add_argument("--input", default=predictions_file, help="Predictions JSON file")
+    parser.add_argument("--chunk-size", type=_chunk_size_arg, default=chunk_size)
+    parser.add_argument("--class", dest="extraction_class", help="Filter by extraction class")
+    parser.add_argument("--location", help="Filter by location")
+    parser.add_argument("--author", help="Filter by tweet author")
+    args = parser.parse_args()
+    try:
+        output_path = export_predictions(
+            args.output,
+            fmt=args.format,
+            predictions_file=args.input,
+            chunk_size=args.chunk_size,
+            extraction_class=args.extraction_class,
+            location=args.location,
+            author=args.author,
+        )
+        print(f"✅ Predictions exported to: {output_path}")
+    except Exception as e:
+        print(f"❌ Error exporting predictions: {str(e)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ from dotenv import load_dotenv
 from collections import defaultdict
 import textwrap
 import langextract as lx
+from prediction_records import Prediction, Tweet, load_predictions, save_predictions
 
 # Load environment variables
 load_dotenv()
@@ -117,6 +118,7 @@ def process_tweets(input_file=input_file, output_file=output_file):
     for i, tweet in enumerate(tweets):
         tweet_text = tweet.get("tweetText", "")
         tweet_id = tweet.get("id", "")
+        tweet_record = Tweet.from_source(tweet)
         try:
             print(f"Processing tweet {i+1}/{len(tweets)} (ID: {tweet_id})")
             result = lx.extract(
@@ -138,46 +140,9 @@ def process_tweets(input_file=input_file, output_file=output_file):
                 for document in documents:
                     if hasattr(document, "extractions"):
                         for extraction in document.extractions:
-                            prediction = {
-                                "extraction_class": extraction.extraction_class,
-                                "extraction_text": extraction.extraction_text,
-                                "charInterval": (
-                                    {
-                                        "start": getattr(
-                                            extraction.char_interval, "start_pos", None
-                                        ),
-                                        "end": getattr(
-                                            extraction.char_interval, "end_pos", None
-                                        ),
-                                    }
-                                    if hasattr(extraction, "char_interval")
-                                    and extraction.char_interval
-                                    else None
-                                ),
-                                "alignmentStatus": (
-                                    extraction.alignment_status.name
-                                    if extraction.alignment_status
-                                    else None
-                                ),
-                                "location": extraction.attributes.get("location", ""),
-                                "prediction": extraction.attributes.get(
-                                    "prediction", ""
-                                ),
-                                "justification": extraction.attributes.get(
-                                    "justification", ""
-                                ),
-                                "original_tweet": {
-                                    "id": tweet_id,
-                                    "text": tweet_text,
-                                    "author": tweet.get("tweetAuthor", ""),
-                                    "handle": tweet.get("handle", ""),
-                                    "created_at": tweet.get("createdAt", ""),
-                                    "url": tweet.get("tweetURL", ""),
-                                    "likes": tweet.get("likeCount", ""),
-                                    "retweets": tweet.get("retweetCount", ""),
-                                    "views": tweet.get("views", ""),
-                                },
-                            }
+                            prediction = Prediction.from_extraction(
+                                extraction, tweet_record
+                            )
                             extracted_predictions.append(prediction)
                             print(
                                 f"  ✓ Extracted: [{extraction.extraction_class}] '{extraction.extraction_text}'"
@@ -195,24 +160,7 @@ def process_tweets(input_file=input_file, output_file=output_file):
 
     # Save results
     try:
-        # Serialize safely (convert non-serializable fields)
-        def safe_json(obj):
-            if hasattr(obj, "__dict__"):
-                return str(obj)
-            if isinstance(obj, lx.data.CharInterval):
-                return {"start": obj.start_pos, "end": obj.end_pos}
-            if isinstance(obj, lx.data.AlignmentStatus):
-                return obj.value
-            return str(obj)
-
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(
-                extracted_predictions,
-                f,
-                indent=2,
-                ensure_ascii=False,
-                default=safe_json,
-            )
+        save_predictions(extracted_predictions, output_file)
         print(f"\n=== EXTRACTION COMPLETE ===")
         print(f"Total tweets processed: {processed_count}")
         print(f"Errors encountered: {error_count}")
@@ -223,8 +171,8 @@ def process_tweets(input_file=input_file, output_file=output_file):
             classes = {}
             locations = {}
             for pred in extracted_predictions:
-                extraction_class = pred.get("extraction_class", "unknown")
-                location = pred.get("location", "unknown")
+                extraction_class = pred.extraction_class or "unknown"
+                location = pred.location or "unknown"
                 classes[extraction_class] = classes.get(extraction_class, 0) + 1
                 locations[location] = locations.get(location, 0) + 1
             print(f"\n=== SUMMARY STATISTICS ===")
@@ -315,9 +263,7 @@ def extract_predictions(input_file=input_file, output_file=output_file):
     process_tweets(input_file, output_file)
     # create_visualization()
     if os.path.exists(output_file):
-        with open(output_file, "r", encoding="utf-8") as f:
-            predictions = json.load(f)
-        return predictions
+        return load_predictions(output_file)
     return []
 
 
@@ -0,0 +1,327 @@
+import json
+from dataclasses import dataclass
+from typing import Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Flattened column names, same as pd.json_normalize(predictions, sep="_")
+ROW_COLUMNS = [
+    "extraction_class",
+    "extraction_text",
+    "charInterval_start",
+    "charInterval_end",
+    "alignmentStatus",
+    "location",
+    "prediction",
+    "justification",
+    "original_tweet_id",
+    "original_tweet_text",
+    "original_tweet_author",
+    "original_tweet_handle",
+    "original_tweet_created_at",
+    "original_tweet_url",
+    "original_tweet_likes",
+    "original_tweet_retweets",
+    "original_tweet_views",
+    "validated",
+    "outcome",
+]
+
+# Tweet keys mapped to record fields, anything else is kept in Tweet.extra
+TWEET_KEYS = {
+    "id",
+    "text",
+    "author",
+    "handle",
+    "created_at",
+    "url",
+    "likes",
+    "retweets",
+    "views",
+}
+
+# Prediction keys mapped to record fields, anything else is kept in Prediction.extra
+PREDICTION_KEYS = {
+    "extraction_class",
+    "extraction_text",
+    "charInterval",
+    "alignmentStatus",
+    "location",
+    "prediction",
+    "justification",
+    "original_tweet",
+    "validated",
+    "outcome",
+}
+
+
+def _to_int(value):
+    """
+    Parse engagement counts such as 2147, 2147.0, "1,024" or "12.0".
+    None when missing, invalid, non-integral or a bool.
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    try:
+        number = float(str(value).replace(",", "").strip())
+    except ValueError:
+        return None
+    if not number.is_integer():
+        return None
+    return int(number)
+
+
+@dataclass
+class Tweet:
+    """
+    Tweet metadata shared by every prediction extracted from it.
+    extra holds any other "original_tweet" keys so saving never drops them.
+    """
+
+    __slots__ = (
+        "id",
+        "text",
+        "author",
+        "handle",
+        "created_at",
+        "url",
+        "likes",
+        "retweets",
+        "views",
+        "extra",
+    )
+    id: str
+    text: str
+    author: str
+    handle: str
+    created_at: str
+    url: str
+    likes: Optional[int]
+    retweets: Optional[int]
+    views: Optional[int]
+    extra: dict
+
+    @classmethod
+    def from_source(cls, tweet):
+        """Build from a tweets.json row (CSV column names)"""
+        return cls(
+            id=tweet.get("id", ""),
+            text=tweet.get("tweetText", ""),
+            author=tweet.get("tweetAuthor", ""),
+            handle=tweet.get("handle", ""),
+            created_at=tweet.get("createdAt", ""),
+            url=tweet.get("tweetURL", ""),
+            likes=_to_int(tweet.get("likeCount")),
+            retweets=_to_int(tweet.get("retweetCount")),
+            views=_to_int(tweet.get("views")),
+            extra={},
+        )
+
+    @classmethod
+    def from_dict(cls, tweet):
+        """Build from the "original_tweet" object of predictions.json"""
+        return cls(
+            id=tweet.get("id", ""),
+            text=tweet.get("text", ""),
+            author=tweet.get("author", ""),
+            handle=tweet.get("handle", ""),
+            created_at=tweet.get("created_at", ""),
+            url=tweet.get("url", ""),
+            likes=_to_int(tweet.get("likes")),
+            retweets=_to_int(tweet.get("retweets")),
+            views=_to_int(tweet.get("views")),
+            extra={key: value for key, value in tweet.items() if key not in TWEET_KEYS},
+        )
+
+    def to_dict(self):
+        data = {
+            "id": self.id,
+            "text": self.text,
+            "author": self.author,
+            "handle": self.handle,
+            "created_at": self.created_at,
+            "url": self.url,
+            "likes": self.likes,
+            "retweets": self.retweets,
+            "views": self.views,
+        }
+        data.update(self.extra)
+        return data
+
+
+@dataclass
+class Prediction:
+    """
+    A single extraction, referencing (not copying) its source tweet.
+    validated/outcome are None until the prediction is reviewed, and extra
+    holds any other predictions.json keys so saving never drops them.
+    """
+
+    __slots__ = (
+        "extraction_class",
+        "extraction_text",
+        "char_start",
+        "char_end",
+        "alignment_status",
+        "location",
+        "prediction",
+        "justification",
+        "tweet",
+        "validated",
+        "outcome",
+        "extra",
+    )
+    extraction_class: str
+    extraction_text: str
+    char_start: Optional[int]
+    char_end: Optional[int]
+    alignment_status: Optional[str]
+    location: str
+    prediction: str
+    justification: str
+    tweet: Tweet
+    validated: Optional[bool]
+    outcome: Optional[bool]
+    extra: dict
+
+    @classmethod
+    def from_extraction(cls, extraction, tweet):
+        """Build from a LangExtract extraction and its Tweet"""
+        char_interval = getattr(extraction, "char_interval", None)
+        attributes = extraction.attributes or {}
+        return cls(
+            extraction_class=extraction.extraction_class,
+            extraction_text=extraction.extraction_text,
+            char_start=getattr(char_interval, "start_pos", None),
+            char_end=getattr(char_interval, "end_pos", None),
+            alignment_status=(
+                extraction.alignment_status.name
+                if extraction.alignment_status
+                else None
+            ),
+            location=attributes.get("location", ""),
+            prediction=attributes.get("prediction", ""),
+            justification=attributes.get("justification", ""),
+            tweet=tweet,
+            validated=None,
+            outcome=None,
+            extra={},
+        )
+
+    @classmethod
+    def from_dict(cls, prediction, tweets=None):
+        """
+        Build from a predictions.json object.
+        Pass the same tweets dict across calls to share Tweet objects by id
+        (tweets without an id are never shared).
+        """
+        char_interval = prediction.get("charInterval") or {}
+        tweet_data = prediction.get("original_tweet") or {}
+        tweet_id = tweet_data.get("id", "")
+        tweet = None
+        if tweets is not None and tweet_id:
+            tweet = tweets.get(tweet_id)
+        if tweet is None:
+            tweet = Tweet.from_dict(tweet_data)
+            if tweets is not None and tweet_id:
+                tweets[tweet_id] = tweet
+        return cls(
+            extraction_class=prediction.get("extraction_class", ""),
+            extraction_text=prediction.get("extraction_text", ""),
+            char_start=char_interval.get("start"),
+            char_end=char_interval.get("end"),
+            alignment_status=prediction.get("alignmentStatus"),
+            location=prediction.get("location", ""),
+            prediction=prediction.get("prediction", ""),
+            justification=prediction.get("justification", ""),
+            tweet=tweet,
+            validated=prediction.get("validated"),
+            outcome=prediction.get("outcome"),
+            # Explicit "validated": null / "outcome": null go to extra so they survive a save
+            extra={
+                key: value
+                for key, value in prediction.items()
+                if key not in PREDICTION_KEYS
+                or (key in ("validated", "outcome") and value is None)
+            },
+        )
+
+    def to_dict(self):
+        """Nested dict in the predictions.json layout"""
+        data = {
+            "extraction_class": self.extraction_class,
+            "extraction_text": self.extraction_text,
+            "charInterval": (
+                {"start": self.char_start, "end": self.char_end}
+                if self.char_start is not None or self.char_end is not None
+                else None
+            ),
+            "alignmentStatus": self.alignment_status,
+            "location": self.location,
+            "prediction": self.prediction,
+            "justification": self.justification,
+            "original_tweet": self.tweet.to_dict(),
+        }
+        data.update(self.extra)
+        if self.validated is not None:
+            data["validated"] = self.validated
+        if self.outcome is not None:
+            data["outcome"] = self.outcome
+        return data
+
+    def to_row(self):
+        """Flat dict keyed by ROW_COLUMNS"""
+        tweet = self.tweet
+        return {
+            "extraction_class": self.extraction_class,
+            "extraction_text": self.extraction_text,
+            "charInterval_start": self.char_start,
+            "charInterval_end": self.char_end,
+            "alignmentStatus": self.alignment_status,
+            "location": self.location,
+            "prediction": self.prediction,
+            "justification": self.justification,
+            "original_tweet_id": tweet.id,
+            "original_tweet_text": tweet.text,
+            "original_tweet_author": tweet.author,
+            "original_tweet_handle": tweet.handle,
+            "original_tweet_created_at": tweet.created_at,
+            "original_tweet_url": tweet.url,
+            "original_tweet_likes": tweet.likes,
+            "original_tweet_retweets": tweet.retweets,
+            "original_tweet_views": tweet.views,
+            "validated": self.validated,
+            "outcome": self.outcome,
+        }
+
+
+def dumps_predictions(predictions, indent=True):
+    """Encode predictions to predictions.json bytes, using orjson when installed"""
+    data = [prediction.to_dict() for prediction in predictions]
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode(
+        "utf-8"
+    )
+
+
+def loads_predictions(data):
+    """Decode predictions.json bytes into Prediction records with shared tweets"""
+    raw = orjson.loads(data) if orjson is not None else json.loads(data)
+    tweets = {}
+    return [Prediction.from_dict(prediction, tweets) for prediction in raw]
+
+
+def save_predictions(predictions, output_file):
+    with open(output_file, "wb") as f:
+        f.write(dumps_predictions(predictions))
+
+
+def load_predictions(predictions_file):
+    with open(predictions_file, "rb") as f:
+        return loads_predictions(f.read())
@@ -1,5 +1,6 @@
 import os
 import json
+from functools import partial
 import pandas as pd
 from dotenv import load_dotenv
 from collections import Counter
@@ -9,6 +10,8 @@ import plotly.express as px
 import plotly.graph_objects as go
 from convert_to_json import convert_csv_to_json
 from extract_prediction import extract_predictions
+from export_predictions import EXPORT_FORMATS, EXPORT_MIME_TYPES, read_export
+from prediction_records import ROW_COLUMNS, load_predictions
 
 # Load environment variables
 load_dotenv()
@@ -23,8 +26,7 @@ output_file = "predictions.json"
 def load_data(predictions_file=output_file, tweets_file=input_file):
     st.cache_data.clear()
     if os.path.exists(predictions_file):
-        with open(predictions_file, "r", encoding="utf-8") as f:
-            predictions = json.load(f)
+        predictions = load_predictions(predictions_file)
     else:
         predictions = []
     if os.path.exists(tweets_file):
@@ -37,13 +39,9 @@ def load_data(predictions_file=output_file, tweets_file=input_file):
 
 def calculate_stats(predictions):
     total = len(predictions)
-    validated = len([p for p in predictions if p.get("validated", False)])
-    correct = len(
-        [p for p in predictions if p.get("validated") and p.get("outcome") is True]
-    )
-    incorrect = len(
-        [p for p in predictions if p.get("validated") and p.get("outcome") is False]
-    )
+    validated = len([p for p in predictions if p.validated])
+    correct = len([p for p in predictions if p.validated and p.outcome is True])
+    incorrect = len([p for p in predictions if p.validated and p.outcome is False])
     accuracy = (correct / validated * 100) if validated > 0 else 0
     return {
         "total": total,
@@ -100,7 +98,7 @@ def main():
     )
 
     predictions, tweets = load_data()
-    df = pd.json_normalize(predictions, sep="_")
+    df = pd.DataFrame([p.to_row() for p in predictions], columns=ROW_COLUMNS)
     df["original_tweet_created_at"] = pd.to_datetime(df["original_tweet_created_at"])
     # Sidebar controls
     with st.sidebar:
@@ -171,6 +169,29 @@ def main():
                 filtered_df["original_tweet_author"] == selected_author
             ]
 
+        # Export filtered predictions
+        export_col, format_col = st.columns([3, 1])
+        with format_col:
+            export_format = st.selectbox("Export format:", EXPORT_FORMATS)
+        with export_col:
+            st.markdown(f"**{len(filtered_df)}** predictions match the filters")
+            # The export only runs when the button is clicked, on Streamlit's
+            # download thread, so reruns never touch the export data
+            st.download_button(
+                "Download Export",
+                data=partial(
+                    read_export,
+                    export_format,
+                    predictions_file=output_file,
+                    extraction_class=selected_class,
+                    location=selected_location,
+                    author=selected_author,
+                ),
+                file_name=f"predictions.{export_format}",
+                mime=EXPORT_MIME_TYPES[export_format],
+                on_click="ignore",
+            )
+
         # Display predictions
         for idx, (_, row) in enumerate(filtered_df.iterrows(), start=1):
             readable_date = row["original_tweet_created_at"].strftime("%B %d, %Y %H:%M")
@@ -202,14 +223,13 @@ def main():
             df.groupby("extraction_class")
             .agg(
                 total_likes=pd.NamedAgg(
-                    column="original_tweet_likes", aggfunc=lambda x: x.astype(int).sum()
+                    column="original_tweet_likes", aggfunc="sum"
                 ),
                 total_retweets=pd.NamedAgg(
-                    column="original_tweet_retweets",
-                    aggfunc=lambda x: x.astype(int).sum(),
+                    column="original_tweet_retweets", aggfunc="sum"
                 ),
                 total_views=pd.NamedAgg(
-                    column="original_tweet_views", aggfunc=lambda x: x.astype(int).sum()
+                    column="original_tweet_views", aggfunc="sum"
                 ),
             )
             .reset_index()
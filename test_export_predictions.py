@@ -0,0 +1,201 @@
+import os
+import csv
+import json
+import sys
+import pytest
+import export_predictions as ep
+
+
+def make_prediction(extraction_class="war", location="Europe", author="Aravind", **tweet):
+    original_tweet = {
+        "id": "1",
+        "text": "Tweet text",
+        "author": author,
+        "handle": "@aravind",
+        "created_at": "2025-09-14 22:51:42",
+        "url": "https://x.com/aravind/status/1",
+        "likes": "2147",
+        "retweets": "283",
+        "views": "34894",
+    }
+    original_tweet.update(tweet)
+    return {
+        "extraction_class": extraction_class,
+        "extraction_text": "Europe into a war with Russia",
+        "charInterval": {"start": 0, "end": 10},
+        "alignmentStatus": "MATCH_EXACT",
+        "location": location,
+        "prediction": "Prediction",
+        "justification": "Justification",
+        "original_tweet": original_tweet,
+    }
+
+
+def write_file(tmp_path, content):
+    path = tmp_path / "predictions.json"
+    path.write_text(content, encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("read_size", [1, 7, 100, ep.read_size])
+def test_iter_predictions_matches_json_load(read_size):
+    with open(ep.predictions_file, "r", encoding="utf-8") as f:
+        expected = json.load(f)
+    assert list(ep.iter_predictions(read_size=read_size)) == expected
+
+
+@pytest.mark.parametrize("read_size", [1, 7])
+def test_iter_predictions_values_longer_than_read_size(tmp_path, read_size):
+    predictions = [
+        make_prediction(text="x" * 500),
+        12345,
+        0.5,
+        1e5,
+        -2.5e-3,
+        "a, ] string",
+        [1, [2]],
+    ]
+    path = write_file(tmp_path, json.dumps(predictions, indent=2))
+    assert list(ep.iter_predictions(path, read_size=read_size)) == predictions
+
+
+@pytest.mark.parametrize("content", ["[0.5]", "[1e5]", "[12, -2.5E-3]"])
+@pytest.mark.parametrize("read_size", [1, 7, 64])
+def test_iter_predictions_numbers_across_reads(tmp_path, content, read_size):
+    path = write_file(tmp_path, content)
+    assert list(ep.iter_predictions(path, read_size=read_size)) == json.loads(content)
+
+
+@pytest.mark.parametrize("content", ["[]", "  [ \n ]  ", "", "[1]\n\n"])
+def test_iter_predictions_empty_or_trailing_whitespace(tmp_path, content):
+    path = write_file(tmp_path, content)
+    assert list(ep.iter_predictions(path, read_size=1)) == json.loads(content or "[]")
+
+
+@pytest.mark.parametrize("content", ["[", '[{"a": 1}', '[{"a": 1},', '[{"a": 1'])
+def test_iter_predictions_truncated(tmp_path, content):
+    path = write_file(tmp_path, content)
+    with pytest.raises(ValueError):
+        list(ep.iter_predictions(path, read_size=1))
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["[,,1]", "[1,,2]", "[1 2]", "[1,]", "{}", "[1]]", "[1] [2]", "[1]x", "[]1"],
+)
+@pytest.mark.parametrize("read_size", [1, 64])
+def test_iter_predictions_malformed(tmp_path, content, read_size):
+    path = write_file(tmp_path, content)
+    with pytest.raises(ValueError):
+        list(ep.iter_predictions(path, read_size=read_size))
+
+
+def test_matches_filters():
+    prediction = make_prediction()
+    assert ep.matches_filters(prediction)
+    assert ep.matches_filters(prediction, "All", "All", "All")
+    assert ep.matches_filters(prediction, extraction_class="war")
+    assert not ep.matches_filters(prediction, extraction_class="politics")
+    assert ep.matches_filters(prediction, location="Europe")
+    assert not ep.matches_filters(prediction, location="India")
+    assert ep.matches_filters(prediction, author="Aravind")
+    assert not ep.matches_filters(prediction, author="Ankit")
+
+
+def test_flatten_prediction_parses_counts_leniently():
+    row = ep.flatten_prediction(make_prediction(likes="1,024", retweets="", views="n/a"))
+    assert list(row) == ep.EXPORT_COLUMNS
+    assert row["original_tweet_likes"] == 1024
+    assert row["original_tweet_retweets"] is None
+    assert row["original_tweet_views"] is None
+
+
+def test_export_filters_rows(tmp_path):
+    predictions = [
+        make_prediction("war", "Europe", "Aravind"),
+        make_prediction("politics", "India", "Ankit"),
+        make_prediction("war", "India", "Ankit"),
+    ]
+    path = write_file(tmp_path, json.dumps(predictions))
+    output = str(tmp_path / "out.jsonl")
+    ep.export_predictions(output, predictions_file=path, extraction_class="war", author="Ankit")
+    with open(output, "r", encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f]
+    assert [(r["extraction_class"], r["location"]) for r in rows] == [("war", "India")]
+
+
+def test_export_csv_header_only_when_nothing_matches(tmp_path):
+    path = write_file(tmp_path, json.dumps([make_prediction()]))
+    output = str(tmp_path / "out.csv")
+    ep.export_predictions(output, predictions_file=path, author="Nobody")
+    with open(output, "r", encoding="utf-8", newline="") as f:
+        assert list(csv.reader(f)) == [ep.EXPORT_COLUMNS]
+
+
+def test_export_csv_chunks(tmp_path):
+    path = write_file(tmp_path, json.dumps([make_prediction() for _ in range(5)]))
+    blocks = list(ep.iter_export_bytes("csv", path, chunk_size=2))
+    assert len(blocks) == 3
+    assert b"".join(blocks).decode("utf-8").count("\n") == 6
+
+
+def test_export_parquet_row_group_per_chunk(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = write_file(tmp_path, json.dumps([make_prediction() for _ in range(5)]))
+    blocks = list(ep.iter_export_bytes("parquet", path, chunk_size=2))
+    # One block per row group plus the footer
+    assert len(blocks) == 4
+    output = tmp_path / "out.parquet"
+    output.write_bytes(b"".join(blocks))
+    parquet_file = pq.ParquetFile(str(output))
+    assert parquet_file.num_row_groups == 3
+    assert parquet_file.read().num_rows == 5
+
+
+def test_export_rejects_non_object_elements(tmp_path):
+    path = write_file(tmp_path, json.dumps([make_prediction(), 1]))
+    with pytest.raises(ValueError, match="predictions.json"):
+        list(ep.iter_export_chunks(path))
+
+
+def test_read_export_removes_its_file(tmp_path):
+    path = write_file(tmp_path, json.dumps([make_prediction()]))
+    folder = tmp_path / "exports"
+    data = ep.read_export("jsonl", path, export_folder=str(folder))
+    assert json.loads(data)["extraction_class"] == "war"
+    assert list(folder.iterdir()) == []
+
+
+def test_read_export_removes_its_file_on_failure(tmp_path):
+    path = write_file(tmp_path, "[1]")
+    folder = tmp_path / "exports"
+    with pytest.raises(ValueError):
+        ep.read_export("csv", path, export_folder=str(folder))
+    assert list(folder.iterdir()) == []
+
+
+def test_remove_stale_exports(tmp_path):
+    stale = tmp_path / "stale.csv"
+    fresh = tmp_path / "fresh.csv"
+    stale.write_text("old")
+    fresh.write_text("new")
+    os.utime(stale, (0, 0))
+    ep.remove_stale_exports(str(tmp_path), max_age=60)
+    assert [p.name for p in tmp_path.iterdir()] == ["fresh.csv"]
+
+
+def test_export_rejects_bad_arguments(tmp_path):
+    path = write_file(tmp_path, "[]")
+    with pytest.raises(ValueError):
+        ep.iter_export_bytes("xml", path)
+    with pytest.raises(ValueError):
+        ep.iter_export_bytes("csv", path, chunk_size=0)
+
+
+@pytest.mark.parametrize("value", ["0", "-5"])
+def test_cli_rejects_chunk_size_below_one(monkeypatch, tmp_path, value):
+    monkeypatch.setattr(
+        sys, "argv", ["export_predictions.py", str(tmp_path / "out.csv"), "--chunk-size", value]
+    )
+    with pytest.raises(SystemExit):
+        ep.main()
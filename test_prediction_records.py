@@ -0,0 +1,85 @@
+import json
+import prediction_records as pr
+
+
+def make_prediction(tweet_id="1", author="Aravind", **extra):
+    prediction = {
+        "extraction_class": "war",
+        "extraction_text": "Europe into a war with Russia",
+        "charInterval": {"start": 0, "end": 10},
+        "alignmentStatus": "MATCH_EXACT",
+        "location": "Europe",
+        "prediction": "Prediction",
+        "justification": "Justification",
+        "original_tweet": {
+            "id": tweet_id,
+            "text": f"Tweet by {author}",
+            "author": author,
+            "handle": f"@{author.lower()}",
+            "created_at": "2025-09-14 22:51:42",
+            "url": f"https://x.com/{author.lower()}/status/{tweet_id}",
+            "likes": 2147,
+            "retweets": 283,
+            "views": 34894,
+        },
+    }
+    prediction.update(extra)
+    return prediction
+
+
+def loads(predictions):
+    return pr.loads_predictions(json.dumps(predictions).encode("utf-8"))
+
+
+def test_tweets_shared_by_id():
+    records = loads([make_prediction("1"), make_prediction("1"), make_prediction("2")])
+    assert records[0].tweet is records[1].tweet
+    assert records[0].tweet is not records[2].tweet
+
+
+def test_tweets_without_id_not_shared():
+    records = loads([make_prediction("", "X"), make_prediction("", "Y")])
+    assert records[0].tweet is not records[1].tweet
+    assert [r.tweet.author for r in records] == ["X", "Y"]
+
+
+def test_counts_missing_or_invalid_are_none():
+    tweet = pr.Tweet.from_source(
+        {"id": "1", "likeCount": "1,024", "retweetCount": "", "views": "n/a"}
+    )
+    assert (tweet.likes, tweet.retweets, tweet.views) == (1024, None, None)
+    tweet = pr.Tweet.from_dict({"likes": 2147.0, "retweets": "12.0", "views": 1.5})
+    assert (tweet.likes, tweet.retweets, tweet.views) == (2147, 12, None)
+    tweet = pr.Tweet.from_dict({"likes": True, "retweets": False, "views": "1e3"})
+    assert (tweet.likes, tweet.retweets, tweet.views) == (None, None, 1000)
+
+
+def test_round_trip_keeps_validation_and_unknown_keys():
+    predictions = [
+        make_prediction(validated=True, outcome=False, note="checked"),
+        make_prediction("2"),
+        make_prediction("3", validated=None, outcome=None),
+    ]
+    predictions[1]["original_tweet"]["replyCount"] = 28
+    records = loads(predictions)
+    assert records[0].validated is True and records[0].outcome is False
+    assert records[1].validated is None
+    assert json.loads(pr.dumps_predictions(records)) == predictions
+
+
+def test_round_trip_sample_file():
+    with open("predictions.json", "r", encoding="utf-8") as f:
+        expected = json.load(f)
+    for prediction in expected:
+        tweet = prediction["original_tweet"]
+        for key in ("likes", "retweets", "views"):
+            tweet[key] = int(tweet[key])
+    records = pr.load_predictions("predictions.json")
+    assert json.loads(pr.dumps_predictions(records)) == expected
+
+
+def test_to_row_matches_columns():
+    row = loads([make_prediction(validated=True, outcome=True)])[0].to_row()
+    assert list(row) == pr.ROW_COLUMNS
+    assert row["original_tweet_likes"] == 2147
+    assert row["validated"] is True